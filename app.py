@@ -6,36 +6,102 @@ Speech Translation Avatar Application
 Provides real-time speech translation with Azure Avatar synthesis
 """
 
+# Monkey patch before any other import so sockets, locks and sleeps are green
+import eventlet
+eventlet.monkey_patch()
+
+import array
+import atexit
 import azure.cognitiveservices.speech as speechsdk
 import base64
+import collections
+import ctypes
+import dataclasses
 import datetime
+import functools
+import hashlib
 import html
 import json
+import logging
+import logging.handlers
+import orjson
 import os
 from pathlib import Path
-import random
+import re
 import requests
-import string
+import secrets
 import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from flask import Flask, Response, render_template, request, redirect, url_for
+from eventlet import tpool
+from flask import Flask, Response, jsonify, render_template, request, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
+from flask.typing import ResponseReturnValue
 from flask_socketio import SocketIO, join_room, emit
+from requests.adapters import HTTPAdapter
 
 # Load environment variables from .env file (use explicit path to ensure correct file is loaded)
 env_path = Path(__file__).parent / '.env'
 load_dotenv(dotenv_path=env_path, override=True)
 
-# Debug: Print loaded config
-print(f"[Config] Loaded .env from: {env_path}")
-print(f"[Config] SPEECH_REGION = {os.environ.get('SPEECH_REGION')}")
-print(f"[Config] SPEECH_KEY = {os.environ.get('SPEECH_KEY')}")
+class NativeQueueListener(logging.handlers.QueueListener):
+    """QueueListener on a native thread - a green one would block the hub waiting on the native queue"""
+    def start(self):
+        self._thread = eventlet.patcher.original('threading').Thread(target=self._monitor, daemon=True)
+        self._thread.start()
+
+
+# Logging - records are queued and written to stderr by a native thread, so neither the eventlet hub
+# nor Speech SDK callback threads wait on the stream. Set LOG_LEVEL=DEBUG for per-utterance traces
+log_queue = eventlet.patcher.original('queue').SimpleQueue()
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+log_listener = NativeQueueListener(log_queue, log_stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on shutdown
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+# Debug: Log loaded config
+logger.debug("[Config] Loaded .env from: %s", env_path)
+logger.debug("[Config] SPEECH_REGION = %s", os.environ.get('SPEECH_REGION'))
+logger.debug("[Config] SPEECH_KEY present = %s", bool(os.environ.get('SPEECH_KEY')))
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson - used by jsonify and request.get_json"""
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Create the Flask app
 app = Flask(__name__, template_folder='.')
+app.json = OrjsonJSONProvider(app)
+
+# Shared session state (optional) - set REDIS_URL to share sessions across workers
+redis_url = os.environ.get('REDIS_URL')  # e.g. redis://localhost:6379/0
+session_ttl_seconds = 86400  # Redis sessions expire 24 hours after their last save, read or listener join
+
+
+class OrjsonSocketJson:
+    """orjson adapter for the Socket.IO json option, which calls dumps/loads with stdlib keyword arguments"""
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
 
-# Create the SocketIO instance
-socketio = SocketIO(app)
+
+# Create the SocketIO instance (Redis message queue fans emits out across workers)
+socketio = SocketIO(app, async_mode='eventlet', message_queue=redis_url, json=OrjsonSocketJson)
 
 # Environment variables
 # Speech resource (required)
@@ -43,106 +109,320 @@ speech_region = os.environ.get('SPEECH_REGION')  # e.g. westus2
 speech_key = os.environ.get('SPEECH_KEY')
 speech_private_endpoint = os.environ.get('SPEECH_PRIVATE_ENDPOINT')  # Optional
 enable_token_auth_for_speech = os.environ.get('ENABLE_TOKEN_AUTH', 'false').lower() == 'true'
+speech_token_refresh_enabled = bool(enable_token_auth_for_speech or speech_private_endpoint)
 
 # Customized ICE server (optional)
 ice_server_url = os.environ.get('ICE_SERVER_URL')
 ice_server_url_remote = os.environ.get('ICE_SERVER_URL_REMOTE')
 ice_server_username = os.environ.get('ICE_SERVER_USERNAME')
 ice_server_password = os.environ.get('ICE_SERVER_PASSWORD')
+custom_ice_token = None
+if ice_server_url and ice_server_username and ice_server_password:
+    custom_ice_token = orjson.dumps({
+        'Urls': [ice_server_url],
+        'Username': ice_server_username,
+        'Password': ice_server_password
+    }).decode()
 
 # Default settings
 default_tts_voice = 'DragonLatestNeural'
 enable_websockets = True
+min_sentence_length = 10  # Shorter fragments wait for more text before synthesis
+sentence_boundary = re.compile(r'(?<!\bDr)(?<!\bMr)(?<!\bMs)(?<!\bMrs)(?<!\bSt)[.!?](?=\s)')
+audio_frame_bytes = 320  # 10 ms of 16 kHz, 16-bit, mono PCM
+speaker_chunk_bytes = 4096 * 2  # One speaker.js audioData message (4096 int16 samples, 256 ms)
+# Server-side backlog before the oldest audio is dropped: 4 speaker messages (~1 s), so messages that
+# arrive together after an uplink hiccup fit. The SDK buffers whatever has been written on its own side
+audio_backlog_frames = 4 * -(-speaker_chunk_bytes // audio_frame_bytes)
+audio_write_bytes = 3200  # Write the push stream in chunks of at least 100 ms...
+audio_write_max_delay = 0.1  # ...or whatever has arrived once the oldest frame waited this long
+synthesizer_pool_size = int(os.environ.get('SYNTHESIZER_POOL_SIZE', 8))  # Idle synthesizers kept warm
+synthesizer_prewarm_count = int(os.environ.get('SYNTHESIZER_PREWARM', 2))  # Synthesizers built at startup
+tts_max_concurrency = int(os.environ.get('TTS_MAX_CONCURRENCY', 32))  # Match the Speech resource quota
 
 # Global variables
-client_contexts = {}  # Client contexts
+client_contexts = {}  # Client id -> ClientContext
 speech_token = None  # Speech token
+speech_token_expiry = 0.0  # Speech token expiry (epoch seconds)
+token_refresh_margin_seconds = 30  # Refresh tokens this long before they expire
 ice_token = None  # ICE token
-sessions = {}  # Active translation sessions
-session_listeners = {}  # Track listeners per session
+sessions = {}  # Active translation sessions (in-process store)
+listener_sessions = {}  # Socket.IO sid -> session id, for this worker's sockets
+state_lock = threading.Lock()  # Guards the in-process stores above
+session_clients = {}  # Session id -> ids of this worker's clients linked to it
+pending_listener_updates = {}  # Session id -> monotonic time of the first unbroadcast join/leave
+broadcast_listener_counts = {}  # Session id -> last listener count broadcast, to skip no-op updates
+speaker_sockets = {}  # Socket.IO sid -> id of the client streaming audio over it, for this worker's sockets
+listener_update_settle_seconds = 0.5  # Let join/leave storms collect this long before broadcasting
+
+# Sharded locks for client_contexts entries. These are native locks because Speech SDK callbacks
+# run on native threads; critical sections only touch the dict, so they never block for long.
+client_locks = [eventlet.patcher.original('threading').RLock() for _ in range(16)]
+
+# Shared HTTP session so token refreshes reuse pooled TLS connections
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+http_timeout_seconds = 5
+
+# Idle avatar synthesizers kept warm for the next listener connect
+synthesizer_pool = collections.deque()
+
+# Azure AD credential for private endpoints - created once so its credential chain
+# probe and internal token cache are reused across refreshes
+azure_credential = None
+if speech_private_endpoint:
+    from azure.identity import DefaultAzureCredential
+    azure_credential = DefaultAzureCredential(exclude_shared_token_cache_credential=True)
+
+# Worker pool for avatar synthesis so requests don't wait on speech results
+tts_pool = ThreadPoolExecutor(max_workers=tts_max_concurrency)
+# Every SDK wait runs on an eventlet tpool thread (20 by default), so size tpool to the TTS cap plus
+# the dispatcher's permanently blocked get and one spare. Must run before tpool's first use
+tpool.set_num_threads(tts_max_concurrency + 2)
+
+# Hand-off from Speech SDK callbacks (native threads) to green threads - see dispatchTranslationEvents
+translation_events = eventlet.patcher.original('queue').SimpleQueue()
+translation_backlogs = {}  # Room id -> utterances waiting for that room's in-order worker
+# Wake the dispatcher's blocked get at exit - tpool joins its threads at exit (runs after this)
+atexit.register(translation_events.put, None)
+
+# Redis client for the shared store. client_contexts stays local because it holds
+# Speech SDK handles, so a load balancer must route each client to the same worker.
+redis_client = None
+if redis_url:
+    import redis
+    redis_client = redis.Redis(connection_pool=redis.ConnectionPool.from_url(redis_url, decode_responses=True))
+
+
+def getSessionInfo(session_id: str) -> dict:
+    """Look up a session by id, refreshing its TTL - returns None if it does not exist"""
+    if not session_id:
+        return None
+    if redis_client:
+        key = f'sess:{session_id}'
+        pipe = redis_client.pipeline()
+        pipe.get(key)
+        pipe.expire(key, session_ttl_seconds)
+        session_json = pipe.execute()[0]
+        return orjson.loads(session_json) if session_json else None
+    with state_lock:
+        return sessions.get(session_id)
+
+
+def sessionExists(session_id: str) -> bool:
+    """Check whether a session exists"""
+    if not session_id:
+        return False
+    if redis_client:
+        return bool(redis_client.exists(f'sess:{session_id}'))
+    with state_lock:
+        return session_id in sessions
+
+
+def saveSession(session: dict):
+    """Create or update a session, refreshing its TTL"""
+    session_id = session['id']
+    if redis_client:
+        redis_client.setex(f'sess:{session_id}', session_ttl_seconds, orjson.dumps(session))
+        return
+    with state_lock:
+        sessions[session_id] = session
+
+
+def deleteSession(session_id: str):
+    """Remove a session and its listener tracking"""
+    if redis_client:
+        redis_client.delete(f'sess:{session_id}', f'listeners:{session_id}', f'lastcount:{session_id}')
+        return
+    with state_lock:
+        sessions.pop(session_id, None)
+
+
+def addSessionListener(session_id: str, sid: str) -> int:
+    """Track a listener socket for a session, refreshing its TTL - returns the new listener count"""
+    with state_lock:
+        listener_sessions[sid] = session_id
+    if not redis_client:
+        return getListenerCount(session_id)  # The socket is already in the listener room
+    key = f'listeners:{session_id}'
+    pipe = redis_client.pipeline()
+    pipe.sadd(key, sid)
+    pipe.expire(key, session_ttl_seconds)
+    pipe.expire(f'sess:{session_id}', session_ttl_seconds)
+    pipe.scard(key)
+    return pipe.execute()[-1]
+
+
+def removeSessionListener(sid: str):
+    """Stop tracking a listener socket - returns (session_id, new count) or (None, 0)"""
+    with state_lock:
+        session_id = listener_sessions.pop(sid, None)
+    if not session_id:
+        return None, 0
+    if not redis_client:
+        # Socket.IO drops the socket from its rooms after the disconnect handler returns
+        return session_id, max(0, getListenerCount(session_id) - 1)
+    key = f'listeners:{session_id}'
+    pipe = redis_client.pipeline()
+    pipe.srem(key, sid)
+    pipe.scard(key)
+    return session_id, pipe.execute()[-1]
+
+
+def getListenerCount(session_id: str) -> int:
+    """Get the number of listeners connected to a session"""
+    if redis_client:
+        return redis_client.scard(f'listeners:{session_id}')
+    # Single worker - Socket.IO's room registry already tracks the listener sockets
+    return len(socketio.server.manager.rooms.get('/', {}).get(listenerRoom(session_id), ()))
+
+
+def swapBroadcastListenerCount(session_id: str, listener_count: int):
+    """Record the listener count being broadcast - returns the previous one (None if unknown)"""
+    if redis_client:
+        # Shared across workers, since the count itself is cluster-wide
+        key = f'lastcount:{session_id}'
+        pipe = redis_client.pipeline()
+        pipe.getset(key, listener_count)
+        pipe.expire(key, session_ttl_seconds)
+        previous = pipe.execute()[0]
+        return int(previous) if previous is not None else None
+    previous = broadcast_listener_counts.get(session_id)
+    if listener_count:
+        broadcast_listener_counts[session_id] = listener_count
+    else:
+        broadcast_listener_counts.pop(session_id, None)  # Don't keep entries for empty sessions
+    return previous
+
+
+def listenerRoom(session_id: str) -> str:
+    """Socket.IO room holding only the listener sockets of a session (the speaker also joins session_id)"""
+    return f'listeners:{session_id}'
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SessionConfig:
+    """Validated speaker settings for a translation session (field names match the session dict)"""
+    name: str
+    sourceLanguage: str = 'en-US'
+    targetLanguage: str = 'es-ES'
+    targetVoice: str = None
+    avatarCharacter: str = 'lisa'
+    avatarStyle: str = 'casual-sitting'
+    backgroundColor: str = '#FFFFFFFF'
+    isCustomAvatar: bool = False
+    useBuiltInVoice: bool = False  # For custom avatar voice sync
+    transparentBackground: bool = False
+    videoCrop: bool = False
+    
+    @classmethod
+    def fromRequest(cls, data: dict, session_id: str) -> 'SessionConfig':
+        """Build from createSession JSON - blank strings fall back to defaults, whitespace is trimmed"""
+        if not isinstance(data, dict):
+            raise ValueError('Request body must be a JSON object')
+        
+        def text(key: str, default: str) -> str:
+            value = data.get(key) or default
+            if not isinstance(value, str):
+                raise ValueError(f'{key} must be a string')
+            return value.strip()
+        
+        return cls(
+            name=text('sessionName', f'Session {session_id}'),
+            sourceLanguage=text('sourceLanguage', 'en-US'),
+            targetLanguage=text('targetLanguage', 'es-ES'),
+            targetVoice=text('targetVoice', '') or None,
+            avatarCharacter=text('avatarCharacter', 'lisa'),
+            avatarStyle=text('avatarStyle', 'casual-sitting'),
+            backgroundColor=text('backgroundColor', '#FFFFFFFF'),
+            isCustomAvatar=bool(data.get('isCustomAvatar', False)),
+            useBuiltInVoice=bool(data.get('useBuiltInVoice', False)),
+            transparentBackground=bool(data.get('transparentBackground', False)),
+            videoCrop=bool(data.get('videoCrop', False)))
+    
+    def toDict(self) -> dict:
+        """Session dict fields for storage and the sessionInfo response"""
+        return dataclasses.asdict(self)
 
 
-def initializeClient() -> uuid.UUID:
+class LazyJson:
+    """Defers indented JSON formatting until a log record is actually emitted"""
+    __slots__ = ('value', 'path')
+    
+    def __init__(self, value, *path: str):
+        self.value = value  # Object or JSON string
+        self.path = path  # Optional keys to drill into before formatting
+    
+    def __str__(self) -> str:
+        value = json.loads(self.value) if isinstance(self.value, str) else self.value
+        for key in self.path:
+            value = value[key]
+        return json.dumps(value, indent=2)
+
+
+def clientLock(client_id: str):
+    """Lock guarding one client's context - clients hash across 16 shards"""
+    return client_locks[hash(client_id) & 15]
+
+
+@dataclasses.dataclass(slots=True)
+class ClientContext:
+    """Per-client avatar and translation state (mutate under clientLock)"""
+    tts_voice: str
+    speech_synthesizer: speechsdk.SpeechSynthesizer = None
+    speech_synthesizer_connection: speechsdk.Connection = None
+    speech_synthesizer_connected: bool = False
+    translation_recognizer: speechsdk.translation.TranslationRecognizer = None
+    custom_voice_endpoint_id: str = None
+    session_id: str = None  # Link to translation session
+    push_audio_stream: speechsdk.audio.PushAudioInputStream = None  # For browser audio streaming
+    audio_frames: collections.deque = None  # Bounded backlog of 10 ms frames waiting for the push stream
+    audio_ready: threading.Event = None  # Wakes the audio pump when frames arrive or the stream is detached
+    sentence_buffer: str = ''  # Streamed text waiting for a sentence boundary
+
+
+def initializeClient() -> str:
     """Initialize a new client session"""
-    client_id = uuid.uuid4()
-    client_contexts[client_id] = {
-        'speech_synthesizer': None,
-        'speech_synthesizer_connection': None,
-        'speech_synthesizer_connected': False,
-        'tts_voice': default_tts_voice,
-        'translation_recognizer': None,
-        'custom_voice_endpoint_id': None,
-        'session_id': None,  # Link to translation session
-        'push_audio_stream': None  # For browser audio streaming
-    }
-    print(f'[Client] New client initialized: {client_id}')
+    client_id = str(uuid.uuid4())
+    client_context = ClientContext(tts_voice=default_tts_voice)
+    with clientLock(client_id):
+        client_contexts[client_id] = client_context
+    logger.debug('[Client] New client initialized: %s', client_id)
     return client_id
 
 
+def linkClientSession(client_id: str, client_context: ClientContext, session_id: str):
+    """Link a client to a translation session and keep the session_clients index in step"""
+    with clientLock(client_id):
+        previous_session_id = client_context.session_id
+        client_context.session_id = session_id
+    with state_lock:
+        previous_clients = session_clients.get(previous_session_id)
+        if previous_clients is not None:
+            previous_clients.discard(client_id)
+        session_clients.setdefault(session_id, set()).add(client_id)
+
+
+def getSessionClients(session_id: str) -> list:
+    """Contexts of this worker's clients linked to a session"""
+    with state_lock:
+        client_ids = list(session_clients.get(session_id, ()))
+    return [(cid, client_contexts[cid]) for cid in client_ids]
+
+
 def generateSessionCode() -> str:
     """Generate a unique 6-digit session code"""
     while True:
-        code = ''.join(random.choices(string.digits, k=6))
-        if code not in sessions:
+        code = f'{secrets.randbelow(1_000_000):06d}'
+        if not sessionExists(code):
             return code
 
 
-def connectAvatarInternal(client_id: uuid.UUID, local_sdp: str, avatar_character: str, 
-                         avatar_style: str, background_color: str, is_custom_avatar: bool, 
-                         transparent_background: bool, video_crop: bool, use_built_in_voice: bool = False) -> str:
-    """Internal method to connect avatar - returns remote SDP"""
-    client_context = client_contexts.get(client_id)
-    if not client_context:
-        raise Exception('Client not found')
-    
-    # Disconnect if already connected
-    if client_context['speech_synthesizer']:
-        disconnectAvatarInternal(client_id)
-    
-    avatar_character = (avatar_character or 'lisa').strip()
-    avatar_style = (avatar_style or '').strip()
-    background_color = (background_color or '#FFFFFFFF').strip()
-    is_custom_avatar = bool(is_custom_avatar)
-    use_built_in_voice = bool(use_built_in_voice)
-
-    print(f"[Avatar] Connecting - Character: {avatar_character}, Custom: {is_custom_avatar}, Voice: {client_context['tts_voice']}")
-    print(f"[Avatar] Using Region: {speech_region}, Key Present: {bool(speech_key)}")
-    
-    # Configure speech service
-    if speech_private_endpoint:
-        speech_private_endpoint_wss = speech_private_endpoint.replace('https://', 'wss://')
-        if enable_token_auth_for_speech:
-            speech_config = speechsdk.SpeechConfig(
-                endpoint=f'{speech_private_endpoint_wss}/tts/cognitiveservices/websocket/v1?enableTalkingAvatar=true')
-            speech_config.authorization_token = speech_token
-        else:
-            speech_config = speechsdk.SpeechConfig(
-                subscription=speech_key,
-                endpoint=f'{speech_private_endpoint_wss}/tts/cognitiveservices/websocket/v1?enableTalkingAvatar=true')
-    else:
-        if enable_token_auth_for_speech:
-            speech_config = speechsdk.SpeechConfig(
-                endpoint=f'wss://{speech_region}.tts.speech.microsoft.com/cognitiveservices/websocket/v1?enableTalkingAvatar=true')
-            speech_config.authorization_token = speech_token
-        else:
-            speech_config = speechsdk.SpeechConfig(
-                subscription=speech_key,
-                endpoint=f'wss://{speech_region}.tts.speech.microsoft.com/cognitiveservices/websocket/v1?enableTalkingAvatar=true')
-    
-    # Create speech synthesizer
-    client_context['speech_synthesizer'] = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
-    speech_synthesizer = client_context['speech_synthesizer']
-    
-    # Get ICE server configuration
-    ice_token_obj = json.loads(ice_token)
-    if ice_server_url and ice_server_username and ice_server_password:
-        ice_token_obj = {
-            'Urls': [ice_server_url_remote] if ice_server_url_remote else [ice_server_url],
-            'Username': ice_server_username,
-            'Password': ice_server_password
-        }
-    
-    # Build avatar configuration
+@functools.lru_cache(maxsize=256)
+def getAvatarConfigTemplate(avatar_character: str, avatar_style: str, background_color: str,
+                            is_custom_avatar: bool, transparent_background: bool, video_crop: bool,
+                            use_built_in_voice: bool) -> str:
+    """Serialize the avatar config once per configuration, with {local_sdp} and {ice_servers} placeholders"""
     effective_style = '' if is_custom_avatar else avatar_style
     
     avatar_config = {
@@ -151,12 +431,8 @@ def connectAvatarInternal(client_id: uuid.UUID, local_sdp: str, avatar_character
                 'protocol': {
                     'name': "WebRTC",
                     'webrtcConfig': {
-                        'clientDescription': local_sdp,
-                        'iceServers': [{
-                            'urls': [ice_token_obj['Urls'][0]],
-                            'username': ice_token_obj['Username'],
-                            'credential': ice_token_obj['Password']
-                        }]
+                        'clientDescription': '__LOCAL_SDP__',
+                        'iceServers': '__ICE_SERVERS__'
                     },
                 },
                 'format': {
@@ -185,70 +461,214 @@ def connectAvatarInternal(client_id: uuid.UUID, local_sdp: str, avatar_character
         }
     }
     
-    # Debug: Print avatar config
-    print(f"[Avatar Config] talkingAvatar: {json.dumps(avatar_config['synthesis']['video']['talkingAvatar'], indent=2)}")
+    # Escape JSON braces for str.format, then swap the quoted sentinels for placeholders
+    template = orjson.dumps(avatar_config).decode().replace('{', '{{').replace('}', '}}')
+    return template.replace('"__LOCAL_SDP__"', '{local_sdp}').replace('"__ICE_SERVERS__"', '{ice_servers}')
+
+
+@functools.lru_cache(maxsize=4)
+def getIceServersJson(ice_token_json: str) -> str:
+    """Serialize the iceServers list for the avatar config - cached until the ICE token rotates"""
+    if ice_server_url and ice_server_username and ice_server_password:
+        ice_token_obj = {
+            'Urls': [ice_server_url_remote] if ice_server_url_remote else [ice_server_url],
+            'Username': ice_server_username,
+            'Password': ice_server_password
+        }
+    else:
+        ice_token_obj = orjson.loads(ice_token_json)
+    
+    return orjson.dumps([{
+        'urls': [ice_token_obj['Urls'][0]],
+        'username': ice_token_obj['Username'],
+        'credential': ice_token_obj['Password']
+    }]).decode()
+
+
+# Avatar endpoint and auth mode are fixed at startup, so resolve them once
+if speech_private_endpoint:
+    avatar_endpoint = f"{speech_private_endpoint.replace('https://', 'wss://')}/tts/cognitiveservices/websocket/v1?enableTalkingAvatar=true"
+else:
+    avatar_endpoint = f'wss://{speech_region}.tts.speech.microsoft.com/cognitiveservices/websocket/v1?enableTalkingAvatar=true'
+
+
+def buildTokenAuthSpeechConfig() -> speechsdk.SpeechConfig:
+    """Avatar SpeechConfig using the current speech token (bound per call since it rotates)"""
+    speech_config = speechsdk.SpeechConfig(endpoint=avatar_endpoint)
+    speech_config.authorization_token = speech_token
+    return speech_config
+
+
+def buildKeyAuthSpeechConfig() -> speechsdk.SpeechConfig:
+    """Avatar SpeechConfig using the subscription key"""
+    return speechsdk.SpeechConfig(subscription=speech_key, endpoint=avatar_endpoint)
+
+
+buildAvatarSpeechConfig = buildTokenAuthSpeechConfig if enable_token_auth_for_speech else buildKeyAuthSpeechConfig
+
+
+def acquireSynthesizer() -> speechsdk.SpeechSynthesizer:
+    """Reuse an idle avatar synthesizer from the pool, or create a new one"""
+    try:
+        speech_synthesizer = synthesizer_pool.pop()
+    except IndexError:
+        return speechsdk.SpeechSynthesizer(speech_config=buildAvatarSpeechConfig(), audio_config=None)
+    
+    if enable_token_auth_for_speech:
+        speech_synthesizer.authorization_token = speech_token  # Pooled instance may hold an old token
+    return speech_synthesizer
+
+
+def releaseSynthesizer(speech_synthesizer: speechsdk.SpeechSynthesizer):
+    """Return a synthesizer whose connection was closed to the pool, if there is room"""
+    if len(synthesizer_pool) < synthesizer_pool_size:
+        synthesizer_pool.append(speech_synthesizer)
+
+
+def prewarmSynthesizers():
+    """Background task to fill the synthesizer pool at startup, so early avatar connects skip SDK setup"""
+    while enable_token_auth_for_speech and not speech_token:
+        socketio.sleep(1)  # Token auth configs need the first token
+    try:
+        for _ in range(min(synthesizer_prewarm_count, synthesizer_pool_size)):
+            releaseSynthesizer(tpool.execute(speechsdk.SpeechSynthesizer,
+                                             speech_config=buildAvatarSpeechConfig(), audio_config=None))
+        logger.debug('[Avatar] Prewarmed %s synthesizer(s)', len(synthesizer_pool))
+    except Exception as e:
+        logger.error('[Avatar] Error prewarming synthesizers: %s', e)
+
+
+def connectAvatarInternal(client_id: str, local_sdp: str, avatar_character: str, 
+                         avatar_style: str, background_color: str, is_custom_avatar: bool, 
+                         transparent_background: bool, video_crop: bool, use_built_in_voice: bool = False) -> str:
+    """Internal method to connect avatar - returns remote SDP"""
+    client_context = client_contexts.get(client_id)
+    if not client_context:
+        raise Exception('Client not found')
+    
+    # Disconnect if already connected
+    if client_context.speech_synthesizer:
+        disconnectAvatarInternal(client_id)
+    
+    avatar_character = (avatar_character or 'lisa').strip()
+    avatar_style = (avatar_style or '').strip()
+    background_color = (background_color or '#FFFFFFFF').strip()
+    is_custom_avatar = bool(is_custom_avatar)
+    use_built_in_voice = bool(use_built_in_voice)
+
+    logger.debug("[Avatar] Connecting - Character: %s, Custom: %s, Voice: %s", avatar_character, is_custom_avatar, client_context.tts_voice)
+    logger.debug("[Avatar] Using Region: %s, Key Present: %s", speech_region, bool(speech_key))
+    
+    # Take a speech synthesizer from the warm pool (or create one)
+    speech_synthesizer = acquireSynthesizer()
+    with clientLock(client_id):
+        client_context.speech_synthesizer = speech_synthesizer
+    
+    # Build avatar configuration from the cached template - only SDP and ICE servers vary per call
+    avatar_config_template = getAvatarConfigTemplate(avatar_character, avatar_style, background_color,
+                                                     is_custom_avatar, transparent_background, video_crop,
+                                                     use_built_in_voice)
+    avatar_config_json = avatar_config_template.format(local_sdp=orjson.dumps(local_sdp).decode(),
+                                                       ice_servers=getIceServersJson(ice_token))
+    
+    # Debug: Log avatar config (only serialized when DEBUG is enabled)
+    logger.debug("[Avatar Config] talkingAvatar: %s",
+                 LazyJson(avatar_config_json, 'synthesis', 'video', 'talkingAvatar'))
     
     # Setup connection callbacks
     connection = speechsdk.Connection.from_speech_synthesizer(speech_synthesizer)
-    connection.connected.connect(lambda evt: print('[Avatar] Connected to avatar service'))
+    connection.connected.connect(lambda evt: logger.debug('[Avatar] Connected to avatar service'))
     
     def tts_disconnected_cb(evt):
-        print('[Avatar] Disconnected from avatar service')
-        client_context['speech_synthesizer_connection'] = None
-        client_context['speech_synthesizer_connected'] = False
+        logger.info('[Avatar] Disconnected from avatar service')
+        with clientLock(client_id):
+            # Ignore late events from a connection that has already been replaced
+            if client_context.speech_synthesizer_connection is connection:
+                client_context.speech_synthesizer_connection = None
+                client_context.speech_synthesizer_connected = False
     
     connection.disconnected.connect(tts_disconnected_cb)
-    connection.set_message_property('speech.config', 'context', json.dumps(avatar_config))
-    client_context['speech_synthesizer_connection'] = connection
-    client_context['speech_synthesizer_connected'] = True
+    connection.set_message_property('speech.config', 'context', avatar_config_json)
+    with clientLock(client_id):
+        client_context.speech_synthesizer_connection = connection
     
-    # Initiate connection by speaking empty string
-    speech_synthesis_result = speech_synthesizer.speak_text_async('').get()
+    # Initiate connection by speaking empty string. The handshake runs in tts_pool (capped at the
+    # Speech resource concurrency) and waits on a native thread, so other requests keep running
+    speech_synthesis_result = tts_pool.submit(
+        lambda: waitForSpeechResult(speech_synthesizer.speak_text_async(''))).result()
     
     if speech_synthesis_result.reason == speechsdk.ResultReason.Canceled:
+        with clientLock(client_id):
+            client_context.speech_synthesizer_connected = False
         cancellation_details = speech_synthesis_result.cancellation_details
         raise Exception(f"Avatar connection failed: {cancellation_details.error_details}")
     
+    # Only now is the avatar ready to speak - translations skip it until this flag is set
+    with clientLock(client_id):
+        if client_context.speech_synthesizer_connection is connection:
+            client_context.speech_synthesizer_connected = True
+    
     # Get remote SDP from result
     turn_start_message = speech_synthesizer.properties.get_property_by_name('SpeechSDKInternal-ExtraTurnStartMessage')
-    remote_sdp = json.loads(turn_start_message)['webrtc']['connectionString']
+    remote_sdp = orjson.loads(turn_start_message)['webrtc']['connectionString']
     
-    print('[Avatar] ✅ Connection established')
+    logger.info('[Avatar] ✅ Connection established')
     return remote_sdp
 
 
+def getTokenExpiry(token: str) -> float:
+    """Read the exp claim (epoch seconds) from a JWT - assumes 10 minutes if it cannot be parsed"""
+    try:
+        payload = token.split('.')[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + 600
+
+
 def refreshSpeechToken():
-    """Background thread to refresh speech token"""
-    global speech_token
+    """Background task to refresh speech token shortly before it expires"""
+    global speech_token, speech_token_expiry
+    backoff = 1
     while True:
+        delay = None
         try:
             if speech_private_endpoint:
-                # For private endpoint, use DefaultAzureCredential
-                from azure.identity import DefaultAzureCredential
-                credential = DefaultAzureCredential()
-                token = credential.get_token('https://cognitiveservices.azure.com/.default')
-                speech_token = token.token
-                print('[Auth] Speech token refreshed (private endpoint)')
+                # For private endpoint, use the shared DefaultAzureCredential
+                token = azure_credential.get_token('https://cognitiveservices.azure.com/.default')
+                speech_token, speech_token_expiry = token.token, float(token.expires_on)
+                logger.info('[Auth] Speech token refreshed (private endpoint)')
             else:
                 # For public endpoint, use subscription key to get token
                 url = f'https://{speech_region}.api.cognitive.microsoft.com/sts/v1.0/issueToken'
                 headers = {'Ocp-Apim-Subscription-Key': speech_key}
-                response = requests.post(url, headers=headers)
+                response = http_session.post(url, headers=headers, timeout=http_timeout_seconds)
                 if response.status_code == 200:
-                    speech_token = response.text
-                    print('[Auth] Speech token refreshed')
+                    speech_token, speech_token_expiry = response.text, getTokenExpiry(response.text)
+                    logger.info('[Auth] Speech token refreshed')
                 else:
-                    print(f'[Auth] Failed to refresh speech token: {response.status_code}')
+                    logger.warning('[Auth] Failed to refresh speech token: %s', response.status_code)
+            
+            if speech_token_expiry - time.time() > token_refresh_margin_seconds:
+                # Refresh ahead of expiry instead of on a fixed schedule
+                delay = max(token_refresh_margin_seconds, speech_token_expiry - time.time() - token_refresh_margin_seconds)
         except Exception as e:
-            print(f'[Auth] Error refreshing speech token: {e}')
+            logger.error('[Auth] Error refreshing speech token: %s', e)
         
-        time.sleep(540)  # Refresh every 9 minutes (tokens valid for 10 minutes)
+        if delay is None:
+            # Retry failures with exponential backoff
+            delay, backoff = backoff, min(backoff * 2, 60)
+        else:
+            backoff = 1
+        time.sleep(delay)
 
 
 def refreshIceToken():
-    """Background thread to refresh ICE token"""
+    """Background task to refresh ICE token"""
     global ice_token
+    backoff = 1
     while True:
+        delay = None
         try:
             if speech_private_endpoint:
                 url = f'{speech_private_endpoint}/tts/cognitiveservices/avatar/relay/token/v1'
@@ -263,17 +683,22 @@ def refreshIceToken():
                 else:
                     headers = {'Ocp-Apim-Subscription-Key': speech_key}
             
-            import requests
-            response = requests.get(url, headers=headers)
+            response = http_session.get(url, headers=headers, timeout=http_timeout_seconds)
             if response.status_code == 200:
                 ice_token = response.text
-                print('[ICE] ICE token refreshed')
+                logger.info('[ICE] ICE token refreshed')
+                delay = 540  # Refresh every 9 minutes
             else:
-                print(f'[ICE] Failed to refresh ICE token: {response.status_code}')
+                logger.warning('[ICE] Failed to refresh ICE token: %s', response.status_code)
         except Exception as e:
-            print(f'[ICE] Error refreshing ICE token: {e}')
+            logger.error('[ICE] Error refreshing ICE token: %s', e)
         
-        time.sleep(540)  # Refresh every 9 minutes
+        if delay is None:
+            # Retry failures with exponential backoff
+            delay, backoff = backoff, min(backoff * 2, 60)
+        else:
+            backoff = 1
+        time.sleep(delay)
 
 
 # Routes
@@ -294,7 +719,7 @@ def speakerView():
 def listenerView(session_id):
     """Listener interface for specific session"""
     # Verify session exists
-    if session_id not in sessions:
+    if not sessionExists(session_id):
         return Response("Session not found", status=404)
     
     client_id = initializeClient()
@@ -308,71 +733,49 @@ def translateView():
 
 
 @app.route("/api/createSession", methods=["POST"])
-def createSession() -> Response:
+def createSession() -> ResponseReturnValue:
     """Create a new translation session"""
     try:
         data = request.get_json()
         session_id = generateSessionCode()
 
-        # Normalize incoming values to avoid whitespace issues
-        session_name = (data.get('sessionName') or f'Session {session_id}').strip()
-        source_language = (data.get('sourceLanguage') or 'en-US').strip()
-        target_language = (data.get('targetLanguage') or 'es-ES').strip()
-        target_voice = (data.get('targetVoice') or '').strip()
-        avatar_character = (data.get('avatarCharacter') or 'lisa').strip()
-        avatar_style = (data.get('avatarStyle') or 'casual-sitting').strip()
-        background_color = (data.get('backgroundColor') or '#FFFFFFFF').strip()
-        is_custom_avatar = bool(data.get('isCustomAvatar', False))
-        use_built_in_voice = bool(data.get('useBuiltInVoice', False))
-        transparent_background = bool(data.get('transparentBackground', False))
-        video_crop = bool(data.get('videoCrop', False))
+        # Validate and normalize incoming values in one pass
+        config = SessionConfig.fromRequest(data, session_id)
 
         # Store session configuration
-        sessions[session_id] = {
+        session = {
             'id': session_id,
-            'name': session_name,
-            'sourceLanguage': source_language,
-            'targetLanguage': target_language,
-            'targetVoice': target_voice or None,
-            'avatarCharacter': avatar_character,
-            'avatarStyle': avatar_style,
-            'backgroundColor': background_color,
-            'isCustomAvatar': is_custom_avatar,
-            'useBuiltInVoice': use_built_in_voice,  # For custom avatar voice sync
-            'transparentBackground': transparent_background,
-            'videoCrop': video_crop,
-            'created_at': datetime.datetime.now().isoformat(),
+            **config.toDict(),
+            'created_at_ts': time.time(),  # Formatted on demand by getSession
             'active': False,
             'speaker_client_id': None
         }
-        
-        # Initialize listener tracking
-        session_listeners[session_id] = set()
+        saveSession(session)
         
         # Generate listener URL
         listener_url = f"{request.host_url}listener/{session_id}"
         
-        print(f"[Session] Created: {session_id} - {sessions[session_id]['name']}")
+        logger.info("[Session] Created: %s - %s", session_id, session['name'])
         
-        return Response(json.dumps({
+        return jsonify({
             'sessionId': session_id,
             'listenerUrl': listener_url,
-            'sessionInfo': sessions[session_id]
-        }), status=200, mimetype='application/json')
+            'sessionInfo': session
+        })
         
     except Exception as e:
         error_msg = f"Failed to create session: {str(e)}"
-        print(f"[Session] {error_msg}")
-        return Response(json.dumps({'error': error_msg}), status=400, mimetype='application/json')
+        logger.error("[Session] %s", error_msg)
+        return jsonify({'error': error_msg}), 400
 
 
 @app.route("/api/getSession/<session_id>", methods=["GET"])
-def getSession(session_id) -> Response:
+def getSession(session_id) -> ResponseReturnValue:
     """Get session information"""
-    if session_id not in sessions:
-        return Response(json.dumps({'error': 'Session not found'}), status=404, mimetype='application/json')
+    session = getSessionInfo(session_id)
+    if not session:
+        return jsonify({'error': 'Session not found'}), 404
     
-    session = sessions[session_id]
     # Return with field names expected by frontend
     session_info = {
         'sessionId': session_id,
@@ -384,44 +787,65 @@ def getSession(session_id) -> Response:
         'avatarCharacter': session.get('avatarCharacter', 'lisa'),
         'avatarStyle': session.get('avatarStyle', 'casual-sitting'),
         'active': session.get('active', False),
-        'listenerCount': len(session_listeners.get(session_id, set()))
+        'listenerCount': getListenerCount(session_id)
     }
+    if request.args.get('includeCreatedAt', 'false').lower() == 'true':
+        session_info['createdAt'] = datetime.datetime.fromtimestamp(session['created_at_ts']).isoformat()
     
-    return Response(json.dumps(session_info), status=200, mimetype='application/json')
+    return jsonify(session_info)
 
 
 @app.route("/api/endSession", methods=["POST"])
-def endSession() -> Response:
+def endSession() -> ResponseReturnValue:
     """End a translation session"""
     try:
-        data = request.get_json()
-        session_id = data.get('sessionId')
+        # Session id from the body (JSON clients) or the SessionId header (speaker.js)
+        data = request.get_json(silent=True) or {}
+        session_id = data.get('sessionId') or request.headers.get('SessionId')
         
-        if session_id not in sessions:
-            return Response(json.dumps({'error': 'Session not found'}), status=404, mimetype='application/json')
+        if not sessionExists(session_id):
+            return jsonify({'error': 'Session not found'}), 404
         
-        # Notify all listeners
-        socketio.emit('sessionEnded', {'sessionId': session_id}, room=session_id)
+        # Notify all listeners with one broadcast - the ending speaker's socket is skipped
+        socketio.emit('sessionEnded', {'sessionId': session_id}, room=session_id,
+                      skip_sid=request.headers.get('SocketId'))
         
-        # Clean up
-        del sessions[session_id]
-        if session_id in session_listeners:
-            del session_listeners[session_id]
+        # Clean up, including the Socket.IO room so it no longer receives emits
+        socketio.close_room(session_id)
+        socketio.close_room(listenerRoom(session_id))
+        deleteSession(session_id)
+        with state_lock:
+            linked_clients = session_clients.pop(session_id, ())
+            # Later disconnects of these sockets must not queue updates for the ended session
+            for sid in [sid for sid, sid_session in listener_sessions.items() if sid_session == session_id]:
+                del listener_sessions[sid]
+        pending_listener_updates.pop(session_id, None)
+        broadcast_listener_counts.pop(session_id, None)
         
-        print(f"[Session] Ended: {session_id}")
+        # Release listener avatars now rather than when the avatar service times them out
+        for cid in linked_clients:
+            if client_contexts[cid].speech_synthesizer:
+                disconnectAvatarInternal(cid)
         
-        return Response(json.dumps({'status': 'ended'}), status=200, mimetype='application/json')
+        logger.info("[Session] Ended: %s", session_id)
+        
+        return jsonify({'status': 'ended'})
         
     except Exception as e:
         error_msg = f"Failed to end session: {str(e)}"
-        print(f"[Session] {error_msg}")
-        return Response(json.dumps({'error': error_msg}), status=400, mimetype='application/json')
+        logger.error("[Session] %s", error_msg)
+        return jsonify({'error': error_msg}), 400
 
 
 @app.route("/api/getSpeechToken", methods=["GET"])
 def getSpeechToken() -> Response:
     """Get speech token for client-side SDK"""
-    response = Response(speech_token, status=200)
+    if speech_token_refresh_enabled and speech_token_expiry - time.time() < 5:
+        # Token is missing or about to expire - ask the client to retry after the refresh
+        return Response('Speech token is being refreshed', status=503, headers={'Retry-After': '5'})
+    
+    # Always revalidate - a cached copy could outlive the token, which is only refreshed 30 s before expiry
+    response = tokenResponse(speech_token, cache_control='no-cache')
     response.headers['SpeechRegion'] = speech_region
     if speech_private_endpoint:
         response.headers['SpeechPrivateEndpoint'] = speech_private_endpoint
@@ -432,28 +856,44 @@ def getSpeechToken() -> Response:
 def getIceToken() -> Response:
     """Get ICE token for WebRTC connection"""
     # Apply customized ICE server if provided
-    if ice_server_url and ice_server_username and ice_server_password:
-        custom_ice_token = json.dumps({
-            'Urls': [ice_server_url],
-            'Username': ice_server_username,
-            'Password': ice_server_password
-        })
-        return Response(custom_ice_token, status=200)
-    return Response(ice_token, status=200)
+    if custom_ice_token:
+        return tokenResponse(custom_ice_token)
+    return tokenResponse(ice_token)
+
+
+@functools.lru_cache(maxsize=8)
+def tokenEtag(token: str) -> str:
+    """Hash a token into an ETag - computed once per token value"""
+    return hashlib.sha1(token.encode()).hexdigest()
+
+
+def tokenResponse(token: str, cache_control: str = 'private, max-age=60') -> Response:
+    """Token response with an ETag, so clients polling an unchanged token get an empty 304"""
+    if token is None:
+        return Response(token, status=200)
+    
+    etag = tokenEtag(token)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(token, status=200)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response
 
 
 @app.route("/api/getStatus", methods=["GET"])
-def getStatus() -> Response:
+def getStatus() -> ResponseReturnValue:
     """Get client session status"""
-    client_id = uuid.UUID(request.headers.get('ClientId'))
+    client_id = request.headers.get('ClientId')
     client_context = client_contexts.get(client_id)
     if not client_context:
-        return Response(json.dumps({'error': 'Client not found'}), status=404)
+        return jsonify({'error': 'Client not found'}), 404
     
     status = {
-        'speechSynthesizerConnected': client_context['speech_synthesizer_connected']
+        'speechSynthesizerConnected': client_context.speech_synthesizer_connected
     }
-    return Response(json.dumps(status), status=200)
+    return jsonify(status)
 
 
 @app.route("/api/connectListenerAvatar", methods=["POST"])
@@ -461,57 +901,55 @@ def connectListenerAvatar() -> Response:
     """Connect listener to avatar service via WebRTC"""
     try:
         # Get client_id and session_id from headers (how listener.js sends them)
-        client_id_str = request.headers.get('ClientId')
+        client_id = request.headers.get('ClientId')
         session_id = request.headers.get('SessionId')
         
         # Get SDP from body - already base64 encoded JSON from listener.js
         # This is the same format as translate.js sends: btoa(JSON.stringify(localDescription))
         local_sdp = request.data.decode('utf-8')
         
-        if not client_id_str:
+        if not client_id:
             return Response('ClientId header is required', status=400)
         
-        if not session_id or session_id not in sessions:
+        session = getSessionInfo(session_id)
+        if not session:
             return Response(f'Invalid session: {session_id}', status=404)
         
         if not local_sdp:
             return Response('SDP body is required', status=400)
         
-        print(f"[Avatar] Received local SDP (length={len(local_sdp)})")
+        logger.debug("[Avatar] Received local SDP (length=%s)", len(local_sdp))
         
-        client_id = uuid.UUID(client_id_str)
         client_context = client_contexts.get(client_id)
         if not client_context:
             return Response(f'Client not found: {client_id}', status=404)
         
-        # Get session configuration
-        session = sessions[session_id]
-        
         # Debug: Print session config (without sensitive data)
-        safe_session = {k: v for k, v in session.items() if 'key' not in k.lower() and 'secret' not in k.lower()}
-        print(f"[Avatar] Session config: {json.dumps({k: str(v) for k, v in safe_session.items()}, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            safe_session = {k: str(v) for k, v in session.items() if 'key' not in k.lower() and 'secret' not in k.lower()}
+            logger.debug("[Avatar] Session config: %s", LazyJson(safe_session))
         
-        # Connect avatar with session configuration
-        avatar_character = (session.get('avatarCharacter') or 'lisa').strip()
-        avatar_style = (session.get('avatarStyle') or '').strip()
-        background_color = (session.get('backgroundColor') or '#FFFFFFFF').strip()
-        is_custom_avatar = bool(session.get('isCustomAvatar', False))
-        transparent_background = bool(session.get('transparentBackground', False))
-        video_crop = bool(session.get('videoCrop', False))
-        use_built_in_voice = bool(session.get('useBuiltInVoice', False))
-
-        target_voice = session.get('targetVoice') or default_tts_voice
-        client_context['tts_voice'] = target_voice.strip() if isinstance(target_voice, str) else default_tts_voice
-        client_context['session_id'] = session_id
+        # Connect avatar with session configuration (normalized by SessionConfig at creation)
+        avatar_character = session['avatarCharacter']
+        avatar_style = session['avatarStyle']
+        background_color = session['backgroundColor']
+        is_custom_avatar = session['isCustomAvatar']
+        transparent_background = session['transparentBackground']
+        video_crop = session['videoCrop']
+        use_built_in_voice = session['useBuiltInVoice']
+
+        with clientLock(client_id):
+            client_context.tts_voice = session['targetVoice'] or default_tts_voice
+        linkClientSession(client_id, client_context, session_id)
         
-        print(f"[Avatar] Connecting listener {client_id} to avatar for session {session_id}")
-        print(f"[Avatar] Config: character={avatar_character}, style={avatar_style}, custom={is_custom_avatar}, useBuiltInVoice={use_built_in_voice}")
+        logger.info("[Avatar] Connecting listener %s to avatar for session %s", client_id, session_id)
+        logger.debug("[Avatar] Config: character=%s, style=%s, custom=%s, useBuiltInVoice=%s", avatar_character, avatar_style, is_custom_avatar, use_built_in_voice)
         
         remote_sdp = connectAvatarInternal(client_id, local_sdp, avatar_character, avatar_style, 
                                           background_color, is_custom_avatar, transparent_background, 
                                           video_crop, use_built_in_voice)
         
-        print(f"[Avatar] ✅ Listener avatar connected successfully")
+        logger.info("[Avatar] ✅ Listener avatar connected successfully")
         
         # Return remote SDP as-is - it's already base64 encoded from Azure
         # listener.js will do atob(remoteSdp) -> JSON.parse()
@@ -519,16 +957,14 @@ def connectListenerAvatar() -> Response:
         
     except Exception as e:
         error_msg = f"Listener avatar connection error: {str(e)}"
-        print(f"[Avatar] {error_msg}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[Avatar] %s", error_msg)
         return Response(error_msg, status=400, mimetype='text/plain')
 
 
 @app.route("/api/connectAvatar", methods=["POST"])
 def connectAvatar() -> Response:
     """Connect to Azure Avatar Service via WebRTC (legacy route)"""
-    client_id = uuid.UUID(request.headers.get('ClientId'))
+    client_id = request.headers.get('ClientId')
     client_context = client_contexts.get(client_id)
     if not client_context:
         return Response('Client not found', status=404)
@@ -541,7 +977,8 @@ def connectAvatar() -> Response:
     use_built_in_voice = request.headers.get('UseBuiltInVoice', 'false').lower() == 'true'
     transparent_background = request.headers.get('TransparentBackground', 'false').lower() == 'true'
     video_crop = request.headers.get('VideoCrop', 'false').lower() == 'true'
-    client_context['tts_voice'] = request.headers.get('TtsVoice', default_tts_voice)
+    with clientLock(client_id):
+        client_context.tts_voice = request.headers.get('TtsVoice', default_tts_voice)
     
     # Get client SDP from request body
     local_sdp = request.data.decode('utf-8')
@@ -553,92 +990,205 @@ def connectAvatar() -> Response:
         return Response(remote_sdp, status=200)
     except Exception as e:
         error_msg = str(e)
-        print(f"[Avatar] {error_msg}")
+        logger.error("[Avatar] %s", error_msg)
         return Response(error_msg, status=400)
 
 
-def disconnectAvatarInternal(client_id: uuid.UUID):
+def disconnectAvatarInternal(client_id: str):
     """Internal method to disconnect avatar"""
     client_context = client_contexts.get(client_id)
     if not client_context:
         return
     
-    if client_context['speech_synthesizer_connection']:
-        client_context['speech_synthesizer_connection'].close()
-        client_context['speech_synthesizer_connection'] = None
+    # Detach the handles under the lock, then close them outside it
+    with clientLock(client_id):
+        connection = client_context.speech_synthesizer_connection
+        speech_synthesizer = client_context.speech_synthesizer
+        client_context.speech_synthesizer_connection = None
+        client_context.speech_synthesizer = None
+        client_context.speech_synthesizer_connected = False
     
-    if client_context['speech_synthesizer']:
-        client_context['speech_synthesizer'] = None
+    if connection:
+        connection.close()
     
-    client_context['speech_synthesizer_connected'] = False
-    print(f'[Avatar] Disconnected for client {client_id}')
+    if speech_synthesizer:
+        releaseSynthesizer(speech_synthesizer)
+    logger.info('[Avatar] Disconnected for client %s', client_id)
 
 
 @app.route("/api/disconnectAvatar", methods=["POST"])
 def disconnectAvatar() -> Response:
     """Disconnect from avatar service"""
-    client_id = uuid.UUID(request.headers.get('ClientId'))
+    client_id = request.headers.get('ClientId')
     disconnectAvatarInternal(client_id)
     return Response('Avatar disconnected', status=200)
 
 
 @app.route("/api/speak", methods=["POST"])
-def speak() -> Response:
-    """Speak SSML using avatar"""
-    client_id = uuid.UUID(request.headers.get('ClientId'))
+def speak() -> ResponseReturnValue:
+    """Queue SSML for the avatar to speak - completion is pushed as a speakDone event"""
+    client_id = request.headers.get('ClientId')
     ssml = request.data.decode('utf-8')
     
     client_context = client_contexts.get(client_id)
     if not client_context:
         return Response('Client not found', status=404)
     
-    speech_synthesizer = client_context['speech_synthesizer']
+    speech_synthesizer = client_context.speech_synthesizer
     if not speech_synthesizer:
         return Response('Avatar not connected', status=400)
     
     try:
-        result = speech_synthesizer.speak_ssml_async(ssml).get()
+        task_id = queueSpeech(speech_synthesizer, client_context.session_id or client_id, ssml)
+        return jsonify({'taskId': task_id, 'status': 'queued'}), 202
+        
+    except Exception as e:
+        error_msg = f"Speech synthesis error: {str(e)}"
+        logger.error("[Speak] %s", error_msg)
+        return Response(error_msg, status=400)
+
+
+@app.route("/api/speakStream", methods=["POST"])
+def speakStream() -> ResponseReturnValue:
+    """Buffer streamed text and queue avatar speech one complete sentence at a time"""
+    client_id = request.headers.get('ClientId')
+    text = request.data.decode('utf-8')
+    
+    client_context = client_contexts.get(client_id)
+    if not client_context:
+        return Response('Client not found', status=404)
+    
+    speech_synthesizer = client_context.speech_synthesizer
+    if not speech_synthesizer:
+        return Response('Avatar not connected', status=400)
+    
+    with clientLock(client_id):
+        sentences, client_context.sentence_buffer = splitSentences(client_context.sentence_buffer + text)
+        buffered = len(client_context.sentence_buffer)
+    
+    room_id = client_context.session_id or client_id
+    task_ids = [queueSpeech(speech_synthesizer, room_id, buildSsml(sentence, client_context.tts_voice))
+                for sentence in sentences]
+    
+    return jsonify({'taskIds': task_ids, 'buffered': buffered}), 202
+
+
+@app.route("/api/speakFlush", methods=["POST"])
+def speakFlush() -> ResponseReturnValue:
+    """Queue whatever streamed text is left in the buffer (end of turn)"""
+    client_id = request.headers.get('ClientId')
+    
+    client_context = client_contexts.get(client_id)
+    if not client_context:
+        return Response('Client not found', status=404)
+    
+    speech_synthesizer = client_context.speech_synthesizer
+    if not speech_synthesizer:
+        return Response('Avatar not connected', status=400)
+    
+    with clientLock(client_id):
+        remaining = client_context.sentence_buffer.strip()
+        client_context.sentence_buffer = ''
+    
+    task_ids = []
+    if remaining:
+        room_id = client_context.session_id or client_id
+        task_ids.append(queueSpeech(speech_synthesizer, room_id, buildSsml(remaining, client_context.tts_voice)))
+    
+    return jsonify({'taskIds': task_ids, 'buffered': 0}), 202
+
+
+def splitSentences(text: str):
+    """Split complete sentences off the front of text - returns (sentences, remainder)"""
+    sentences = []
+    start = 0
+    for match in sentence_boundary.finditer(text):
+        sentence = text[start:match.end()].strip()
+        if len(sentence) >= min_sentence_length:
+            sentences.append(sentence)
+            start = match.end()
+    return sentences, text[start:]
+
+
+def buildSsml(text: str, voice: str, language: str = 'en-US') -> str:
+    """Wrap plain text in SSML for the avatar voice"""
+    return (f"<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='{language}'>"
+            f"<voice name='{voice}'>{html.escape(text)}</voice></speak>")
+
+
+@functools.lru_cache(maxsize=64)
+def getTranslationSsmlPrefix(voice: str, language: str) -> str:
+    """Opening SSML for translated utterances - fixed per voice and language, so built once"""
+    return (f"<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xmlns:mstts='http://www.w3.org/2001/mstts' xml:lang='{language}'>"
+            f"<voice name='{voice}'><mstts:leadingsilence-exact value='0'/>")
+
+
+def buildTranslationSsml(text: str, voice: str, language: str) -> str:
+    """SSML for a translated utterance, on the cached voice/language prefix"""
+    return getTranslationSsmlPrefix(voice, language) + html.escape(text) + '</voice></speak>'
+
+
+def queueSpeech(speech_synthesizer: speechsdk.SpeechSynthesizer, room_id: str, ssml: str) -> str:
+    """Start avatar synthesis and report completion to room_id over Socket.IO - returns the task id"""
+    task_id = str(uuid.uuid4())
+    # Start synthesis here so the SDK queues utterances in request order; only the wait is pooled
+    result_future = speech_synthesizer.speak_ssml_async(ssml)
+    future = tts_pool.submit(waitForSpeechResult, result_future)
+    future.add_done_callback(functools.partial(speakDone, task_id, room_id))
+    return task_id
+
+
+def waitForSpeechResult(result_future):
+    """Wait for a Speech SDK result on a native thread so the eventlet hub keeps running"""
+    return tpool.execute(result_future.get)
+
+
+def speakDone(task_id: str, room_id: str, future):
+    """Notify the client room when a queued /api/speak synthesis finishes"""
+    try:
+        result = future.result()
         if result.reason == speechsdk.ResultReason.Canceled:
             cancellation_details = result.cancellation_details
             error_msg = f"Speech synthesis canceled: {cancellation_details.error_details}"
-            print(f"[Speak] {error_msg}")
-            return Response(error_msg, status=400)
-        
-        print('[Speak] ✅ Speech synthesis completed')
-        return Response('Speech sent', status=200)
-        
+            logger.warning("[Speak] %s", error_msg)
+            status = {'taskId': task_id, 'status': 'error', 'error': error_msg}
+        else:
+            logger.debug('[Speak] ✅ Speech synthesis completed')
+            status = {'taskId': task_id, 'status': 'completed'}
     except Exception as e:
         error_msg = f"Speech synthesis error: {str(e)}"
-        print(f"[Speak] {error_msg}")
-        return Response(error_msg, status=400)
+        logger.error("[Speak] %s", error_msg)
+        status = {'taskId': task_id, 'status': 'error', 'error': error_msg}
+    
+    socketio.emit('speakDone', status, room=room_id)
 
 
 @app.route("/api/startTranslation", methods=["POST"])
-def startTranslation() -> Response:
+def startTranslation() -> ResponseReturnValue:
     """Start translation for a session (speaker initiates)"""
     try:
         data = request.get_json()
         session_id = data.get('sessionId')
         # Get client_id from header (primary) or body (fallback)
-        client_id_str = request.headers.get('ClientId') or data.get('clientId')
+        client_id = request.headers.get('ClientId') or data.get('clientId')
         use_streaming = data.get('useStreaming', False)  # Browser audio streaming mode
         
-        if not client_id_str:
-            return Response(json.dumps({'error': 'ClientId is required'}), status=400, mimetype='application/json')
+        if not client_id:
+            return jsonify({'error': 'ClientId is required'}), 400
         
-        if not session_id or session_id not in sessions:
-            return Response(json.dumps({'error': 'Invalid session'}), status=404, mimetype='application/json')
+        session = getSessionInfo(session_id)
+        if not session:
+            return jsonify({'error': 'Invalid session'}), 404
         
-        client_id = uuid.UUID(client_id_str)
         client_context = client_contexts.get(client_id)
         if not client_context:
-            return Response(json.dumps({'error': 'Client not found'}), status=404, mimetype='application/json')
+            return jsonify({'error': 'Client not found'}), 404
         
         # Link client to session
-        client_context['session_id'] = session_id
-        session = sessions[session_id]
+        linkClientSession(client_id, client_context, session_id)
         session['active'] = True
-        session['speaker_client_id'] = str(client_id)
+        session['speaker_client_id'] = client_id
+        saveSession(session)
         
         # Get translation config from session
         source_language = session['sourceLanguage']
@@ -650,32 +1200,135 @@ def startTranslation() -> Response:
         
     except Exception as e:
         error_msg = f"Failed to start translation: {str(e)}"
-        print(f"[Translation] {error_msg}")
-        return Response(json.dumps({'error': error_msg}), status=400, mimetype='application/json')
+        logger.error("[Translation] %s", error_msg)
+        return jsonify({'error': error_msg}), 400
 
 
 @app.route("/api/translateSpeak", methods=["POST"])
-def translateSpeak() -> Response:
+def translateSpeak() -> ResponseReturnValue:
     """Start continuous speech translation with avatar output (legacy route)"""
-    client_id = uuid.UUID(request.headers.get('ClientId'))
+    client_id = request.headers.get('ClientId')
     source_language = request.headers.get('SourceLanguage', 'en-US')
     target_language = request.headers.get('TargetLanguage', 'es-ES')
     target_voice = request.headers.get('TargetVoice')  # Optional: specific voice for target language
     
     client_context = client_contexts.get(client_id)
     if not client_context:
-        return Response(json.dumps({'error': 'Client not found'}), status=404, mimetype='application/json')
+        return jsonify({'error': 'Client not found'}), 404
     
     return startTranslationInternal(client_id, source_language, target_language, target_voice, None)
 
 
-def startTranslationInternal(client_id: uuid.UUID, source_language: str, target_language: str, 
-                             target_voice: str, session_id: str = None, use_streaming: bool = False) -> Response:
+@dataclasses.dataclass(frozen=True, slots=True)
+class RecognitionConfig:
+    """Settings of one translation recognizer, bound to its callbacks with functools.partial"""
+    client_id: str
+    client_context: ClientContext
+    session_id: str
+    source_language: str
+    target_language: str
+    target_lang_code: str  # Translation key, e.g. 'es' for 'es-ES'
+    target_voice: str
+
+
+def deliverTranslation(config: RecognitionConfig, recognized_text: str, translated_text: str):
+    """Speak a translation on the listener avatars and broadcast it (runs on a green thread)"""
+    # Determine voice to use for avatar speech
+    voice_to_use = config.target_voice if config.target_voice else config.client_context.tts_voice
+    
+    # Build SSML for avatar speech
+    ssml = buildTranslationSsml(translated_text, voice_to_use, config.target_language)
+    
+    # For session-based translation, speak via all listeners' avatars
+    if config.session_id:
+        # Start speech on every listener avatar first, then wait, so the
+        # round trips overlap instead of running one after another
+        pending = []
+        for cid, ctx in getSessionClients(config.session_id):
+            # Snapshot the handle - a concurrent disconnect may clear it. Avatars still
+            # in their WebRTC handshake are skipped rather than sent a doomed request
+            listener_synthesizer = ctx.speech_synthesizer
+            if not listener_synthesizer or not ctx.speech_synthesizer_connected:
+                continue
+            try:
+                pending.append((cid, listener_synthesizer.speak_ssml_async(ssml)))
+            except Exception as speak_err:
+                logger.error("[Translation] Error speaking to listener %s: %s", cid, speak_err)
+        
+        listeners_spoken = 0
+        for cid, speak_future in pending:
+            try:
+                result = waitForSpeechResult(speak_future)
+                if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+                    listeners_spoken += 1
+                else:
+                    logger.warning("[Translation] Avatar speech failed for listener %s: %s", cid, result.reason)
+            except Exception as speak_err:
+                logger.error("[Translation] Error speaking to listener %s: %s", cid, speak_err)
+        
+        if listeners_spoken > 0:
+            logger.debug('[Translation] ✅ Avatar spoke to %s listener(s)', listeners_spoken)
+        else:
+            logger.debug('[Translation] ⚠️ No listeners with avatar connection found')
+    else:
+        # Legacy mode - speak via the client's own avatar
+        own_synthesizer = config.client_context.speech_synthesizer
+        if own_synthesizer:
+            result = waitForSpeechResult(own_synthesizer.speak_ssml_async(ssml))
+            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+                logger.debug('[Translation] ✅ Avatar spoke translation')
+    
+    # Broadcast to session room or client room
+    if enable_websockets:
+        try:
+            room_id = config.session_id if config.session_id else config.client_id
+            # One event for every client - path keeps the legacy response shape
+            socketio.emit("translationResult", {
+                'path': 'api.translation',
+                'sourceText': recognized_text,
+                'translatedText': translated_text,
+                'sourceLanguage': config.source_language,
+                'targetLanguage': config.target_language,
+                'timestamp': time.time()
+            }, room=room_id)
+            
+            logger.debug("[Translation] ✅ Result broadcast to room %s", room_id)
+        except Exception as socket_err:
+            logger.error("[Translation] Socket.IO error: %s", socket_err)
+
+
+def onTranslationRecognized(config: RecognitionConfig, evt):
+    """Speech SDK callback for final recognition results"""
+    if evt.result.reason == speechsdk.ResultReason.TranslatedSpeech:
+        recognized_text = evt.result.text
+        if config.target_lang_code in evt.result.translations:
+            translated_text = evt.result.translations[config.target_lang_code]
+            logger.debug("[Translation] %s → %s", recognized_text, translated_text)
+            # Runs on an SDK thread - hand off so recognition continues while avatars speak
+            room_id = config.session_id or config.client_id
+            translation_events.put((room_id, deliverTranslation, (config, recognized_text, translated_text)))
+    elif evt.result.reason == speechsdk.ResultReason.NoMatch:
+        logger.debug("[Translation] No speech recognized")
+
+
+def onTranslationCanceled(evt):
+    """Speech SDK callback for canceled recognition"""
+    if evt.result.reason == speechsdk.ResultReason.Canceled:
+        cancellation = evt.result.cancellation_details
+        logger.info("[Translation] Canceled: %s", cancellation.reason)
+        if cancellation.reason == speechsdk.CancellationReason.Error:
+            logger.error("[Translation] Error: %s", cancellation.error_details)
+
+
+def startTranslationInternal(client_id: str, source_language: str, target_language: str, 
+                             target_voice: str, session_id: str = None, use_streaming: bool = False) -> ResponseReturnValue:
     """Internal method to start translation"""
     client_context = client_contexts.get(client_id)
     if not client_context:
-        return Response(json.dumps({'error': 'Client not found'}), status=404, mimetype='application/json')
+        return jsonify({'error': 'Client not found'}), 404
     
+    push_stream = None
+    audio_ready = None
     try:
         # Configure speech translation
         if speech_private_endpoint:
@@ -702,189 +1355,156 @@ def startTranslationInternal(client_id: uuid.UUID, source_language: str, target_
             push_stream = speechsdk.audio.PushAudioInputStream(stream_format=audio_format)
             audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
             
-            # Store push stream for receiving audio data
-            client_context['push_audio_stream'] = push_stream
-            print(f"[Translation] Using browser audio streaming mode")
+            # Store push stream for receiving audio data, fed from a bounded frame backlog
+            audio_ready = threading.Event()
+            with clientLock(client_id):
+                previous_ready = client_context.audio_ready
+                client_context.audio_frames = collections.deque(maxlen=audio_backlog_frames)
+                client_context.audio_ready = audio_ready
+                client_context.push_audio_stream = push_stream
+            if previous_ready:
+                previous_ready.set()  # Let the pump of a replaced stream see it and exit
+            logger.info("[Translation] Using browser audio streaming mode")
         else:
             # Use default microphone for local testing
             audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
-            print(f"[Translation] Using local microphone mode")
+            logger.info("[Translation] Using local microphone mode")
         
         # Create translation recognizer
         translation_recognizer = speechsdk.translation.TranslationRecognizer(
             translation_config=translation_config, 
             audio_config=audio_config)
         
-        print(f"[Translation] Starting: {source_language} → {target_language}")
-        
-        # Callback for final recognition results
-        def recognized_cb(evt):
-            if evt.result.reason == speechsdk.ResultReason.TranslatedSpeech:
-                recognized_text = evt.result.text
-                if target_lang_code in evt.result.translations:
-                    translated_text = evt.result.translations[target_lang_code]
-                    print(f"[Translation] {recognized_text} → {translated_text}")
-                    
-                    # Determine voice to use for avatar speech
-                    voice_to_use = target_voice if target_voice else client_context['tts_voice']
-                    
-                    # Build SSML for avatar speech
-                    ssml = f"""<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xmlns:mstts='http://www.w3.org/2001/mstts' xml:lang='{target_language}'>
-                                 <voice name='{voice_to_use}'>
-                                     <mstts:leadingsilence-exact value='0'/>
-                                     {html.escape(translated_text)}
-                                 </voice>
-                               </speak>"""
-                    
-                    # For session-based translation, speak via all listeners' avatars
-                    if session_id:
-                        # Find all listener clients for this session and make their avatars speak
-                        listeners_spoken = 0
-                        for cid, ctx in client_contexts.items():
-                            if ctx.get('session_id') == session_id and ctx.get('speech_synthesizer'):
-                                # This is a listener with an avatar connection
-                                try:
-                                    result = ctx['speech_synthesizer'].speak_ssml_async(ssml).get()
-                                    if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                                        listeners_spoken += 1
-                                    else:
-                                        print(f"[Translation] Avatar speech failed for listener {cid}: {result.reason}")
-                                except Exception as speak_err:
-                                    print(f"[Translation] Error speaking to listener {cid}: {speak_err}")
-                        
-                        if listeners_spoken > 0:
-                            print(f'[Translation] ✅ Avatar spoke to {listeners_spoken} listener(s)')
-                        else:
-                            print(f'[Translation] ⚠️ No listeners with avatar connection found')
-                    else:
-                        # Legacy mode - speak via the client's own avatar
-                        if client_context['speech_synthesizer']:
-                            result = client_context['speech_synthesizer'].speak_ssml_async(ssml).get()
-                            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                                print('[Translation] ✅ Avatar spoke translation')
-                    
-                    # Broadcast to session room or client room
-                    if enable_websockets:
-                        try:
-                            room_id = session_id if session_id else str(client_id)
-                            with app.app_context():
-                                socketio.emit("translationResult", {
-                                    'sourceText': recognized_text,
-                                    'translatedText': translated_text,
-                                    'sourceLanguage': source_language,
-                                    'targetLanguage': target_language,
-                                    'timestamp': datetime.datetime.now().isoformat()
-                                }, room=room_id)
-                                
-                                # Also emit legacy format for backwards compatibility
-                                socketio.emit("response", {
-                                    'path': 'api.translation',
-                                    'sourceText': recognized_text,
-                                    'translatedText': translated_text,
-                                    'sourceLanguage': source_language,
-                                    'targetLanguage': target_language
-                                }, room=room_id)
-                                
-                                print(f"[Translation] ✅ Result broadcast to room {room_id}")
-                        except Exception as socket_err:
-                            print(f"[Translation] Socket.IO error: {socket_err}")
-            elif evt.result.reason == speechsdk.ResultReason.NoMatch:
-                print(f"[Translation] No speech recognized")
-        
-        # Callback for errors
-        def canceled_cb(evt):
-            if evt.result.reason == speechsdk.ResultReason.Canceled:
-                cancellation = evt.result.cancellation_details
-                print(f"[Translation] Canceled: {cancellation.reason}")
-                if cancellation.reason == speechsdk.CancellationReason.Error:
-                    print(f"[Translation] Error: {cancellation.error_details}")
+        logger.info("[Translation] Starting: %s → %s", source_language, target_language)
+        
+        # Callback settings are bound with partial rather than closed over
+        config = RecognitionConfig(client_id, client_context, session_id, source_language,
+                                   target_language, target_lang_code, target_voice)
         
         # Connect callbacks
-        translation_recognizer.recognized.connect(recognized_cb)
-        translation_recognizer.canceled.connect(canceled_cb)
+        translation_recognizer.recognized.connect(functools.partial(onTranslationRecognized, config))
+        translation_recognizer.canceled.connect(onTranslationCanceled)
         
         # Start continuous recognition
         translation_recognizer.start_continuous_recognition()
         
         # Store recognizer in context for later cleanup
-        client_context['translation_recognizer'] = translation_recognizer
+        with clientLock(client_id):
+            client_context.translation_recognizer = translation_recognizer
         
-        return Response(json.dumps({
+        # Only pump audio once recognition is running - frames received until then wait in the backlog
+        if push_stream:
+            socketio.start_background_task(pumpAudioFrames, client_context, push_stream, audio_ready)
+        
+        return jsonify({
             'status': 'started',
             'sourceLanguage': source_language,
             'targetLanguage': target_language,
             'message': 'Translation started. Speak into your microphone.'
-        }), status=200, mimetype='application/json')
+        })
         
     except Exception as e:
         error_msg = f"Translation failed: {str(e)}"
-        print(f"[Translation] {error_msg}")
-        return Response(json.dumps({
+        logger.error("[Translation] %s", error_msg)
+        
+        # Detach the stream stored above so audioData stops queueing into a dead recognizer
+        with clientLock(client_id):
+            if push_stream and client_context.push_audio_stream is push_stream:
+                client_context.push_audio_stream = None
+                client_context.audio_frames = None
+                client_context.audio_ready = None
+            else:
+                push_stream = None  # Replaced by a newer start, which owns it now
+        if push_stream:
+            push_stream.close()
+        
+        return jsonify({
             'status': 'error',
             'error': error_msg
-        }), status=400, mimetype='application/json')
+        }), 400
 
 
 @app.route("/api/stopTranslation", methods=["POST"])
-def stopTranslation() -> Response:
+def stopTranslation() -> ResponseReturnValue:
     """Stop continuous speech translation"""
-    client_id = uuid.UUID(request.headers.get('ClientId'))
+    client_id = request.headers.get('ClientId')
     
     client_context = client_contexts.get(client_id)
     if not client_context:
-        return Response(json.dumps({'error': 'Client not found'}), status=404, mimetype='application/json')
+        return jsonify({'error': 'Client not found'}), 404
     
     try:
-        translation_recognizer = client_context.get('translation_recognizer')
-        
-        if translation_recognizer:
-            translation_recognizer.stop_continuous_recognition()
-            client_context['translation_recognizer'] = None
-            print("[Translation] Stopped")
-        
-        # Close push audio stream if exists
-        push_stream = client_context.get('push_audio_stream')
-        if push_stream:
-            push_stream.close()
-            client_context['push_audio_stream'] = None
-            print("[Translation] Audio stream closed")
+        stopTranslationInternal(client_id, client_context)
         
-        return Response(json.dumps({
+        return jsonify({
             'status': 'stopped',
             'message': 'Translation stopped.'
-        }), status=200, mimetype='application/json')
+        })
         
     except Exception as e:
         error_msg = f"Failed to stop translation: {str(e)}"
-        print(f"[Translation] {error_msg}")
-        return Response(json.dumps({
+        logger.error("[Translation] %s", error_msg)
+        return jsonify({
             'status': 'error',
             'error': error_msg
-        }), status=400, mimetype='application/json')
+        }), 400
+
+
+def stopTranslationInternal(client_id: str, client_context: ClientContext):
+    """Internal method to stop translation and its audio pump"""
+    # Detach the recognizer and push stream under the lock, then stop them outside it
+    with clientLock(client_id):
+        translation_recognizer = client_context.translation_recognizer
+        push_stream = client_context.push_audio_stream
+        audio_ready = client_context.audio_ready
+        client_context.translation_recognizer = None
+        client_context.push_audio_stream = None
+        client_context.audio_frames = None
+        client_context.audio_ready = None
+    
+    # Wake the pump so it sees the detached stream and exits
+    if audio_ready:
+        audio_ready.set()
+    
+    if translation_recognizer:
+        translation_recognizer.stop_continuous_recognition()
+        logger.info("[Translation] Stopped")
+    
+    # Close push audio stream if exists
+    if push_stream:
+        push_stream.close()
+        logger.info("[Translation] Audio stream closed")
 
 
 # Socket.IO event handlers
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
-    print(f'[SocketIO] Client connected: {request.sid}')
+    logger.debug('[SocketIO] Client connected: %s', request.sid)
 
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
-    print(f'[SocketIO] Client disconnected: {request.sid}')
+    logger.debug('[SocketIO] Client disconnected: %s', request.sid)
     
     # Remove from session listeners if applicable
-    for session_id, listeners in list(session_listeners.items()):
-        if request.sid in listeners:
-            listeners.remove(request.sid)
-            print(f'[SocketIO] Removed {request.sid} from session {session_id}')
-            
-            # Update listener count for session
-            emit('listenerCountUpdated', {
-                'count': len(listeners)
-            }, room=session_id)
+    session_id, _ = removeSessionListener(request.sid)
+    if session_id:
+        logger.debug('[SocketIO] Removed %s from session %s', request.sid, session_id)
+        
+        # Coalesced into one listenerCountUpdated broadcast by flushListenerUpdates
+        pending_listener_updates.setdefault(session_id, time.monotonic())
+    
+    # Stop a speaker's translation so its recognizer and audio pump don't outlive the socket
+    client_id = speaker_sockets.pop(request.sid, None)
+    client_context = client_contexts.get(client_id) if client_id else None
+    if client_context:
+        try:
+            stopTranslationInternal(client_id, client_context)
+            logger.info('[SocketIO] Stopped translation of disconnected speaker %s', client_id)
+        except Exception as e:
+            logger.error('[SocketIO] Failed to stop translation of %s: %s', client_id, e)
 
 
 @socketio.on('join')
@@ -892,7 +1512,7 @@ def handle_join(data):
     """Handle client joining room"""
     room = data['room']
     join_room(room)
-    print(f'[SocketIO] Client {request.sid} joined room {room}')
+    logger.debug('[SocketIO] Client %s joined room %s', request.sid, room)
 
 
 @socketio.on('joinSession')
@@ -900,77 +1520,171 @@ def handle_join_session(data):
     """Handle listener joining a translation session"""
     session_id = data.get('sessionId')
     
-    if not session_id or session_id not in sessions:
+    if not sessionExists(session_id):
         emit('error', {'message': 'Invalid session'})
         return
     
-    # Add to session room
+    # Add to session room, and the listener-only room that backs the count
     join_room(session_id)
+    join_room(listenerRoom(session_id))
     
     # Track listener
-    if session_id not in session_listeners:
-        session_listeners[session_id] = set()
-    session_listeners[session_id].add(request.sid)
+    listener_count = addSessionListener(session_id, request.sid)
     
-    print(f'[SocketIO] Listener {request.sid} joined session {session_id}')
+    logger.info('[SocketIO] Listener %s joined session %s', request.sid, session_id)
     
     # Notify speaker of new listener
     emit('listenerJoined', {
         'sessionId': session_id,
-        'listenerCount': len(session_listeners[session_id])
+        'listenerCount': listener_count
     }, room=session_id)
     
-    # Send updated count to all in session
-    emit('listenerCountUpdated', {
-        'count': len(session_listeners[session_id])
-    }, room=session_id)
+    # Coalesced into one listenerCountUpdated broadcast by flushListenerUpdates
+    pending_listener_updates.setdefault(session_id, time.monotonic())
 
 
 @socketio.on('audioData')
 def handle_audio_data(data):
     """Handle incoming audio data from speaker's browser"""
-    try:
-        session_id = data.get('sessionId')
-        client_id_str = data.get('clientId')
-        audio_data = data.get('audio')  # Int16 array
-        
-        if not session_id or not client_id_str or not audio_data:
-            return
-        
-        client_id = uuid.UUID(client_id_str)
-        client_context = client_contexts.get(client_id)
-        
-        if not client_context:
+    if not isinstance(data, dict):
+        return
+    session_id = data.get('sessionId')
+    client_id = data.get('clientId')
+    audio_data = data.get('audio')  # Raw int16 PCM bytes (legacy clients send an int array)
+    
+    # Drop malformed messages before any conversion work - speakers send several a second
+    if not isinstance(session_id, str) or not isinstance(client_id, str) or not audio_data:
+        return
+    
+    client_context = client_contexts.get(client_id)
+    
+    if not client_context:
+        return
+    
+    # Queue audio for the push stream writer of this client
+    audio_frames = client_context.audio_frames
+    audio_ready = client_context.audio_ready
+    if audio_frames is None or audio_ready is None:
+        return
+    
+    # Remember which socket streams for this client, so its disconnect stops the translation
+    speaker_sockets[request.sid] = client_id
+    
+    if isinstance(audio_data, (bytes, bytearray)):
+        audio_bytes = audio_data
+    elif isinstance(audio_data, list):
+        try:
+            # Convert int16 array back to bytes (C loop, no per-sample argument tuple)
+            audio_bytes = array.array('h', audio_data).tobytes()
+        except (TypeError, OverflowError) as e:
+            logger.debug('[AudioData] Dropping malformed samples from %s: %s', client_id, e)
             return
-        
-        # Get the push audio stream for this client
-        push_stream = client_context.get('push_audio_stream')
-        if push_stream:
-            # Convert int16 array back to bytes
-            import struct
-            audio_bytes = struct.pack(f'{len(audio_data)}h', *audio_data)
-            push_stream.write(audio_bytes)
-    except Exception as e:
-        print(f'[AudioData] Error processing audio: {e}')
-
+    else:
+        logger.debug('[AudioData] Dropping audio of type %s from %s', type(audio_data).__name__, client_id)
+        return
+    
+    if len(audio_bytes) % 2:
+        # A partial sample would shift every later sample in the stream
+        logger.debug('[AudioData] Dropping %s bytes of audio from %s (odd length)', len(audio_bytes), client_id)
+        return
+    
+    # Split into 10 ms frames (views, not copies) - a full deque evicts its oldest frame on append
+    frame_count = -(-len(audio_bytes) // audio_frame_bytes)
+    dropped = max(0, len(audio_frames) + frame_count - audio_frames.maxlen)
+    audio_view = memoryview(audio_bytes)
+    audio_frames.extend(audio_view[i:i + audio_frame_bytes]
+                        for i in range(0, len(audio_bytes), audio_frame_bytes))
+    audio_ready.set()
+    if dropped:
+        emit('framesDropped', {'sessionId': session_id, 'frames': dropped, 'ms': dropped * 10})
+
+
+def pumpAudioFrames(client_context: ClientContext, push_stream, audio_ready: threading.Event):
+    """Background task draining the frame backlog into the push stream until it is replaced"""
+    # Frames are coalesced into one preallocated buffer so each SDK write carries ~100 ms. It holds
+    # a just-under-full chunk plus a full backlog, so one drain can never overflow it
+    scratch = bytearray(audio_write_bytes + audio_backlog_frames * audio_frame_bytes)
+    pending = 0
+    flush_at = None
+    while client_context.push_audio_stream is push_stream:
+        audio_frames = client_context.audio_frames
+        while audio_frames:
+            frame = audio_frames.popleft()
+            scratch[pending:pending + len(frame)] = frame
+            pending += len(frame)
+        if pending:
+            if flush_at is None:
+                flush_at = time.monotonic() + audio_write_max_delay
+            if pending >= audio_write_bytes or time.monotonic() >= flush_at:
+                # The SDK only converts bytes or ctypes buffers - a ctypes view skips the bytes() copy
+                push_stream.write((ctypes.c_char * pending).from_buffer(scratch))
+                pending = 0
+                flush_at = None
+        # Sleep until audio arrives or the stream is detached - only a partial write needs a deadline
+        audio_ready.wait(None if flush_at is None else max(0.0, flush_at - time.monotonic()))
+        audio_ready.clear()
+
+
+def dispatchTranslationEvents():
+    """Background task handing work queued by SDK callbacks to per-room green workers, where emits are safe"""
+    while True:
+        # Block on a native thread rather than polling, so an idle server never wakes up
+        event = tpool.execute(translation_events.get)
+        if event is None:
+            return  # Shutting down
+        room_id, handler, args = event
+        backlog = translation_backlogs.get(room_id)
+        if backlog is None:
+            backlog = translation_backlogs[room_id] = collections.deque()
+            socketio.start_background_task(drainTranslations, room_id, backlog)
+        backlog.append((handler, args))
+
+
+def drainTranslations(room_id: str, backlog: collections.deque):
+    """Run one room's queued work in order, so its avatar speech and emits never overtake each other"""
+    while backlog:
+        handler, args = backlog.popleft()
+        try:
+            handler(*args)
+        except Exception as e:
+            logger.error('[Translation] Error delivering to room %s: %s', room_id, e)
+    translation_backlogs.pop(room_id, None)  # No yield since the last check, so nothing was added
 
-# Start background threads
-if enable_token_auth_for_speech or speech_private_endpoint:
-    speech_token_refresh_thread = threading.Thread(target=refreshSpeechToken, daemon=True)
-    speech_token_refresh_thread.start()
 
-ice_token_refresh_thread = threading.Thread(target=refreshIceToken, daemon=True)
-ice_token_refresh_thread.start()
+def flushListenerUpdates():
+    """Background task to broadcast coalesced listener counts, at most once a second per session"""
+    while True:
+        socketio.sleep(1)
+        cutoff = time.monotonic() - listener_update_settle_seconds
+        for session_id, changed_at in list(pending_listener_updates.items()):
+            if changed_at > cutoff:
+                continue  # Pick it up on the next tick
+            pending_listener_updates.pop(session_id, None)
+            try:
+                if not sessionExists(session_id):
+                    broadcast_listener_counts.pop(session_id, None)  # Ended or expired - nobody to tell
+                    continue
+                listener_count = getListenerCount(session_id)
+                if swapBroadcastListenerCount(session_id, listener_count) == listener_count:
+                    continue  # Churn cancelled out, e.g. a listener reconnecting
+                socketio.emit('listenerCountUpdated', {
+                    'count': listener_count
+                }, room=session_id)
+            except Exception as e:
+                logger.error('[SocketIO] Error broadcasting listener count for %s: %s', session_id, e)
+
+
+# Start background tasks (green threads under eventlet)
+if speech_token_refresh_enabled:
+    socketio.start_background_task(refreshSpeechToken)
+
+socketio.start_background_task(refreshIceToken)
+socketio.start_background_task(flushListenerUpdates)
+socketio.start_background_task(dispatchTranslationEvents)
+socketio.start_background_task(prewarmSynthesizers)
 
 
 if __name__ == '__main__':
-    # Run with eventlet for WebSocket support
-    import eventlet
-    import eventlet.wsgi
-    
-    # Monkey patch for eventlet compatibility
-    eventlet.monkey_patch()
-    
     # Get port from environment or use default
     port = int(os.environ.get('PORT', 5000))
     
@@ -982,5 +1696,5 @@ if __name__ == '__main__':
 ╚═══════════════════════════════════════════════════════════╝
     """)
     
-    # Run with socketio
+    # Run with socketio (eventlet server for WebSocket support)
     socketio.run(app, host='0.0.0.0', port=port, debug=False)
@@ -97,9 +97,7 @@ function initializeSocketIO() {
     
     // Legacy response format (backwards compatibility)
     socket.on('response', (data) => {
-        if (data.path === 'api.translation') {
-            handleTranslationResponse(data);
-        } else if (data.path === 'api.sessionEnded') {
+        if (data.path === 'api.sessionEnded') {
             handleSessionEnded();
         } else if (data.path === 'api.speakerSpeaking') {
             showAudioIndicator(data.speaking);
@@ -50,14 +50,19 @@ function initializeSocketIO() {
     
     socket.on('disconnect', () => {
         log('Socket.IO disconnected');
+        
+        // The server stops a speaker's translation when its socket drops
+        if (translationActive) {
+            stopTranslation();
+        }
     });
     
-    socket.on('response', (data) => {
-        if (data.path === 'api.translation') {
-            handleTranslationResponse(data);
-        } else if (data.path === 'api.listenerUpdate') {
-            updateListenerCount(data.listenerCount);
-        }
+    socket.on('translationResult', (data) => {
+        handleTranslationResponse(data);
+    });
+    
+    socket.on('listenerCountUpdated', (data) => {
+        updateListenerCount(data.count);
     });
 }
 
@@ -263,11 +268,11 @@ async function startTranslation() {
                 int16Data[i] = Math.max(-32768, Math.min(32767, Math.floor(inputData[i] * 32768)));
             }
             
-            // Send audio data via Socket.IO
+            // Send audio data via Socket.IO as a binary attachment (raw int16 PCM)
             socket.emit('audioData', {
                 sessionId: sessionId,
                 clientId: clientId,
-                audio: Array.from(int16Data)
+                audio: int16Data.buffer
             });
         };
         
@@ -398,7 +403,8 @@ async function endSession() {
             method: 'POST',
             headers: {
                 'ClientId': clientId,
-                'SessionId': sessionId
+                'SessionId': sessionId,
+                'SocketId': socket.id
             }
         });
         